@@ -4,6 +4,7 @@ Run locally to test functionality
 """
 import sys
 import os
+import logging
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -11,8 +12,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from scraper import ElPaisScraper, create_driver
 from translator import Translator
 from text_analyzer import TextAnalyzer
+from collections import Counter
 from config import MAX_ARTICLES
 
+# Print the scraper's progress messages as they happen
+_scraper_logger = logging.getLogger(ElPaisScraper.__module__)
+_scraper_logger.addHandler(logging.StreamHandler(sys.stdout))
+_scraper_logger.setLevel(logging.INFO)
+
 
 def main():
     """
@@ -81,11 +88,11 @@ def main():
         print(f"Articles with images: {sum(1 for a in articles if a['image_path'])}")
         print(f"Titles translated: {len(english_titles)}")
         
-        # Show repeated words
-        repeated = analyzer.find_repeated_words(english_titles)
+        # Show repeated words (already computed by print_analysis)
+        repeated = analyzer.repeated_words
         if repeated:
             print(f"\nRepeated words (appearing more than twice): {len(repeated)}")
-            for word, count in sorted(repeated.items(), key=lambda x: x[1], reverse=True):
+            for word, count in Counter(repeated).most_common():
                 print(f"  - '{word}': {count} times")
         else:
             print("\nNo words found that appear more than twice across all headers.")
@@ -6,17 +6,35 @@ import re
 from collections import Counter
 
 
+# Anything that isn't a lowercase letter or whitespace
+_CLEAN_RE = re.compile(r"[^a-z\s]")
+
+# Runs of letters, i.e. the words left after clean_text removes everything else
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Function words that aren't counted (English, plus Spanish for untranslated titles)
+STOPWORDS = frozenset({
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "from", "by", "with",
+    "and", "or", "but", "is", "are", "was", "were", "be", "it", "its", "as",
+    "that", "this", "s",
+    "el", "la", "los", "las", "lo", "de", "del", "en", "y", "o", "un", "una",
+    "al", "que", "se", "por", "con", "para", "su", "sus", "es"
+})
+
+
 class TextAnalyzer:
     """Analyzer for finding repeated words in translated headers"""
     
-    def __init__(self, min_repeat_count=2):
+    def __init__(self, min_repeat_count=2, stopwords=STOPWORDS):
         """
         Initialize the analyzer
         
         Args:
             min_repeat_count: Minimum number of times a word must appear to be considered repeated
+            stopwords: Words to leave out of the counts (pass an empty set to count every word)
         """
         self.min_repeat_count = min_repeat_count
+        self.stopwords = frozenset(stopwords)
         self.word_counts = {}
         self.repeated_words = {}
     
@@ -34,7 +52,7 @@ class TextAnalyzer:
         text = text.lower()
         
         # Remove punctuation and special characters, keep only letters and spaces
-        text = re.sub(r'[^a-z\s]', ' ', text)
+        text = _CLEAN_RE.sub(' ', text)
         
         # Split into words and remove empty strings
         words = [word.strip() for word in text.split() if word.strip()]
@@ -51,14 +69,14 @@ class TextAnalyzer:
         Returns:
             dict: Dictionary of word counts
         """
-        all_words = []
+        # Extract the words of all titles in one pass (same words as clean_text)
+        joined = "\n".join(titles).lower()
         
-        for title in titles:
-            words = self.clean_text(title)
-            all_words.extend(words)
-        
-        # Count occurrences
-        self.word_counts = Counter(all_words)
+        # Count occurrences, skipping stopwords
+        stopwords = self.stopwords
+        self.word_counts = Counter(
+            word for word in _WORD_RE.findall(joined) if word not in stopwords
+        )
         
         return self.word_counts
     
@@ -75,6 +93,10 @@ class TextAnalyzer:
         # Count all words
         self.count_words(titles)
         
+        return self._filter_repeated()
+    
+    def _filter_repeated(self):
+        """Pick the repeated words out of the current word counts"""
         # Find words that appear more than min_repeat_count times
         # The task says "more than twice" = 3 or more times
         self.repeated_words = {
@@ -102,10 +124,8 @@ class TextAnalyzer:
         
         word_counts = self.count_words(titles)
         
-        # Sort by count descending
-        sorted_counts = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        for word, count in sorted_counts[:20]:  # Show top 20
+        # Top 20 by count descending
+        for word, count in word_counts.most_common(20):
             print(f"  {word}: {count}")
         
         # Now show repeated words (more than twice)
@@ -113,11 +133,12 @@ class TextAnalyzer:
         print("WORDS REPEATED MORE THAN TWICE")
         print(f"{'='*60}\n")
         
-        repeated = self.find_repeated_words(titles)
+        # Reuse the counts computed above instead of counting the titles again
+        repeated = self._filter_repeated()
         
         if repeated:
             # Sort by count descending
-            sorted_repeated = sorted(repeated.items(), key=lambda x: x[1], reverse=True)
+            sorted_repeated = Counter(repeated).most_common()
             
             print(f"Found {len(sorted_repeated)} words repeated more than twice:\n")
             
@@ -140,7 +161,7 @@ class TextAnalyzer:
             list: List of tuples (word, count)
         """
         word_counts = self.count_words(titles)
-        return sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[:n]
+        return word_counts.most_common(n)
 
 
 if __name__ == "__main__":
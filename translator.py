@@ -2,17 +2,77 @@
 Translation module using Rapid Translate Multi Traduction API
 Translates article titles from Spanish to English
 """
-import requests
-from config import TRANSLATION_API_URL
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from config import TRANSLATION_API_URL, TRANSLATION_CACHE_NAME, TRANSLATION_CACHE_EXPIRE
+
+
+# Maximum number of concurrent translation requests
+MAX_TRANSLATION_WORKERS = 5
+
+# Titles are joined with this marker to translate them in a single request
+BATCH_SEPARATOR = "@@@"
+
+# MyMemory rejects queries longer than this many bytes
+MAX_QUERY_BYTES = 500
+
+
+def _is_successful_translation(response):
+    """Only cache responses that carry an actual translation"""
+    try:
+        return response.status_code == 200 and response.json().get("responseStatus") == 200
+    except ValueError:
+        return False
+
+
+def create_translation_session(pool_maxsize=10, retries=3, backoff_factor=0.3):
+    """
+    Create a session that caches translation API responses on disk
+    
+    Args:
+        pool_maxsize: Maximum number of keep-alive connections per host
+        retries: Number of times a failed request is retried
+        backoff_factor: Backoff factor between retries, in seconds
+        
+    Returns:
+        requests_cache.CachedSession: Session to use for translation requests
+    """
+    session = requests_cache.CachedSession(
+        TRANSLATION_CACHE_NAME,
+        expire_after=TRANSLATION_CACHE_EXPIRE,
+        filter_fn=_is_successful_translation
+    )
+    
+    # Keep-alive connections for the concurrent title requests, retried with backoff
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=retries, backoff_factor=backoff_factor)
+        )
+    )
+    
+    return session
 
 
 class Translator:
     """Translation class using MyMemory API (free tier)"""
     
-    def __init__(self):
+    def __init__(self, session=None):
+        """
+        Initialize the translator
+        
+        Args:
+            session: Optional requests.Session to share a connection pool with other callers
+        """
         self.api_url = TRANSLATION_API_URL
         self.source_lang = "es"  # Spanish
         self.target_lang = "en"  # English
+        # Reuse connections across requests and cache translations between runs
+        self.session = session or create_translation_session()
     
     def translate_text(self, text):
         """
@@ -33,7 +93,7 @@ class Translator:
                 "langpair": f"{self.source_lang}|{self.target_lang}"
             }
             
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self.session.get(self.api_url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -50,6 +110,35 @@ class Translator:
         
         return text  # Return original text if translation fails
     
+    def translate_batch(self, texts):
+        """
+        Translate several texts with a single request
+        
+        Args:
+            texts: List of texts to translate
+            
+        Returns:
+            list: Translated texts, or None if the batch couldn't be translated
+            and split back into the original number of texts
+        """
+        joined = f"\n{BATCH_SEPARATOR}\n".join(texts)
+        
+        if len(joined.encode("utf-8")) > MAX_QUERY_BYTES:
+            return None
+        
+        translated = self.translate_text(joined)
+        
+        # translate_text returns its input unchanged when the request fails
+        if translated == joined:
+            return None
+        
+        parts = [part.strip() for part in translated.split(BATCH_SEPARATOR)]
+        
+        if len(parts) != len(texts):
+            return None
+        
+        return parts
+    
     def translate_titles(self, titles):
         """
         Translate a list of titles
@@ -64,17 +153,23 @@ class Translator:
         print("TRANSLATING ARTICLE TITLES")
         print(f"{'='*60}\n")
         
-        translated_titles = []
+        if not titles:
+            return []
+        
+        # Try a single request for all titles first
+        translated_titles = self.translate_batch(titles)
         
-        for i, title in enumerate(titles):
+        if translated_titles is None:
+            # Fall back to one request per title, issued concurrently;
+            # map() keeps results in input order
+            workers = min(MAX_TRANSLATION_WORKERS, len(titles))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                translated_titles = list(executor.map(self.translate_text, titles))
+        
+        for title, translated in zip(titles, translated_titles):
             print(f"Original (Spanish): {title}")
-            
-            translated = self.translate_text(title)
-            
             print(f"Translated (English): {translated}")
             print("-" * 40)
-            
-            translated_titles.append(translated)
         
         return translated_titles
 
@@ -84,11 +179,11 @@ def translate_with_google_api(text, api_key):
     Alternative: Translate using Google Translate API
     
     Args:
-        text: Text to translate
+        text: Text to translate, or a list of texts to translate in one request
         api_key: Google Translate API key
         
     Returns:
-        str: Translated text
+        str: Translated text (a list of translated texts for list input)
     """
     from google.cloud import translate_v2 as translate
     
@@ -101,6 +196,10 @@ def translate_with_google_api(text, api_key):
             target_language="en"
         )
         
+        # A list input returns one result per text
+        if isinstance(text, list):
+            return [item["translatedText"] for item in result]
+        
         return result["translatedText"]
     except Exception as e:
         print(f"Google Translate API error: {e}")